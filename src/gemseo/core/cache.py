@@ -38,12 +38,13 @@ from numpy import append
 from numpy import array
 from numpy import ascontiguousarray
 from numpy import complex128
-from numpy import concatenate
+from numpy import empty
 from numpy import float64
 from numpy import hstack
 from numpy import int32
 from numpy import int64
 from numpy import ndarray
+from numpy import result_type
 from numpy import uint8
 from numpy import vstack
 from pandas import MultiIndex
@@ -764,24 +765,42 @@ class AbstractFullCache(AbstractCache):
         if not all_output_data:
             raise ValueError("Failed to find outputs in the cache.")
 
+        shared_input_names = list(shared_input_names)
+        shared_output_names = list(shared_output_names)
         variable_names = []
-        for data_name in list(shared_input_names) + list(shared_output_names):
+        for data_name in shared_input_names + shared_output_names:
             data_size = names_to_sizes[data_name]
             if data_size == 1:
                 variable_names.append(data_name)
             else:
                 variable_names += [f"{data_name}_{i + 1}" for i in range(data_size)]
 
-        cache_as_array = vstack(
-            concatenate(
-                [all_input_data[index][name].flatten() for name in shared_input_names]
-                + [
-                    all_output_data[index][name].flatten()
-                    for name in shared_output_names
-                ]
-            )
-            for index in range(len(all_input_data))
+        # The data type is the one of the data, e.g. complex for complex data.
+        dtype = result_type(
+            *{
+                data[name].dtype
+                for input_data, output_data in zip(all_input_data, all_output_data)
+                for data, names in (
+                    (input_data, shared_input_names),
+                    (output_data, shared_output_names),
+                )
+                for name in names
+            }
         )
+        cache_as_array = empty((len(all_input_data), len(variable_names)), dtype=dtype)
+        for row, input_data, output_data in zip(
+            cache_as_array, all_input_data, all_output_data
+        ):
+            first_index = 0
+            for data, names in (
+                (input_data, shared_input_names),
+                (output_data, shared_output_names),
+            ):
+                for name in names:
+                    last_index = first_index + names_to_sizes[name]
+                    row[first_index:last_index] = data[name].ravel()
+                    first_index = last_index
+
         save_data_arrays_to_xml(variable_names, cache_as_array, file_path)
 
     def update(
@@ -2109,7 +2109,7 @@ class MDODiscipline(Serializable):
             file_path: The path to the file to store the discipline.
         """
         with Path(file_path).open("wb") as outfobj:
-            pickler = pickle.Pickler(outfobj, protocol=2)
+            pickler = pickle.Pickler(outfobj, protocol=pickle.HIGHEST_PROTOCOL)
             pickler.dump(self)
 
     @staticmethod
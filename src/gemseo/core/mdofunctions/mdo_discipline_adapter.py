@@ -75,6 +75,7 @@ class MDODisciplineAdapter(MDOFunction):
         self.__output_size = 0
         self.__input_size = 0
         self.__jacobian = None
+        self.__jacobian_blocks = []
         self.__discipline = discipline
         self.__names_to_indices = {}
         self.__names_to_sizes = names_to_sizes or {}
@@ -141,27 +142,44 @@ class MDODisciplineAdapter(MDOFunction):
         if self.__jacobian is None:
             self.__compute_input_indices()
             self.__compute_output_indices()
+            self.__compute_jacobian_blocks()
             if self.__output_size == 1:
                 self.__jacobian = empty(self.__input_size)
             else:
                 self.__jacobian = empty((self.__output_size, self.__input_size))
 
+        jacobian = self.__discipline.jac
         if self.__output_size == 1:
-            output_name = self.__output_names[0]
-            for input_name in self.__input_names:
-                in_indices = self.__input_indices[input_name]
-                jac = self.__discipline.jac[output_name][input_name]
-                self.__jacobian[in_indices] = jac[0, :]
+            for output_name, input_name, indices in self.__jacobian_blocks:
+                self.__jacobian[indices] = jacobian[output_name][input_name][0, :]
         else:
-            for output_name in self.__output_names:
-                out_indices = self.__output_indices[output_name]
-                for input_name in self.__input_names:
-                    in_indices = self.__input_indices[input_name]
-                    jac = self.__discipline.jac[output_name][input_name]
-                    self.__jacobian[out_indices, in_indices] = jac
+            for output_name, input_name, indices in self.__jacobian_blocks:
+                self.__jacobian[indices] = jacobian[output_name][input_name]
 
         return self.__jacobian
 
+    def __compute_jacobian_blocks(self) -> None:
+        """Compute the names and indices of the blocks of the Jacobian array."""
+        if self.__output_size == 1:
+            output_name = self.__output_names[0]
+            self.__jacobian_blocks = [
+                (output_name, input_name, self.__input_indices[input_name])
+                for input_name in self.__input_names
+            ]
+        else:
+            self.__jacobian_blocks = [
+                (
+                    output_name,
+                    input_name,
+                    (
+                        self.__output_indices[output_name],
+                        self.__input_indices[input_name],
+                    ),
+                )
+                for output_name in self.__output_names
+                for input_name in self.__input_names
+            ]
+
     def __create_names_to_indices(self) -> None:
         """Create the map from discipline input names to input vector indices.
 
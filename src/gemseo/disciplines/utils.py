@@ -15,6 +15,7 @@
 """A set of functions to handle disciplines."""
 from __future__ import annotations
 
+from itertools import chain
 from typing import Iterable
 from typing import MutableSequence
 from typing import TYPE_CHECKING
@@ -45,7 +46,7 @@ def __get_all_disciplines(
         return non_scenarios
 
     disciplines_in_scenarios = list(
-        set.union(*(set(scenario.disciplines) for scenario in scenarios))
+        set(chain.from_iterable(scenario.disciplines for scenario in scenarios))
     )
     return disciplines_in_scenarios + non_scenarios
 
@@ -65,9 +66,9 @@ def get_all_inputs(
         The names of the inputs.
     """
     return sorted(
-        set.union(
-            *(
-                set(discipline.get_input_data_names())
+        set(
+            chain.from_iterable(
+                discipline.get_input_data_names()
                 for discipline in __get_all_disciplines(
                     disciplines, skip_scenarios=skip_scenarios
                 )
@@ -91,9 +92,9 @@ def get_all_outputs(
         The names of the outputs.
     """
     return sorted(
-        set.union(
-            *(
-                set(discipline.get_output_data_names())
+        set(
+            chain.from_iterable(
+                discipline.get_output_data_names()
                 for discipline in __get_all_disciplines(
                     disciplines, skip_scenarios=skip_scenarios
                 )
@@ -31,7 +31,8 @@ from __future__ import annotations
 
 import pickle
 from abc import abstractmethod
-from copy import deepcopy
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 from typing import ClassVar
@@ -45,10 +46,12 @@ from typing import Tuple
 from typing import Union
 
 from matplotlib.figure import Figure
+from numpy import absolute
 from numpy import array
+from numpy import concatenate
+from numpy import empty
 from numpy import linspace
 from numpy import ndarray
-from numpy import newaxis
 from numpy import vstack
 from numpy.typing import NDArray
 from strenum import StrEnum
@@ -66,6 +69,7 @@ from gemseo.post.dataset.dataset_plot import DatasetPlotPropertyType
 from gemseo.post.dataset.dataset_plot import VariableType
 from gemseo.post.dataset.radar_chart import RadarChart
 from gemseo.post.dataset.surfaces import Surfaces
+from gemseo.utils.compatibility.matplotlib import use_constrained_layout
 from gemseo.utils.file_path_manager import FilePathManager
 from gemseo.utils.matplotlib_figure import save_show_figure
 from gemseo.utils.metaclasses import ABCGoogleDocstringInheritanceMeta
@@ -76,6 +80,23 @@ FirstOrderIndicesType = Dict[str, List[Dict[str, ndarray]]]
 SecondOrderIndicesType = Dict[str, List[Dict[str, Dict[str, ndarray]]]]
 
 
+@lru_cache(maxsize=32)
+def _get_default_mesh(size: int) -> ndarray:
+    """Return a default 1D mesh of the unit interval.
+
+    The mesh is read-only as it is shared by all the calls with the same ``size``.
+
+    Args:
+        size: The number of nodes of the mesh.
+
+    Returns:
+        The equispaced mesh of the unit interval.
+    """
+    mesh = linspace(0.0, 1.0, size)
+    mesh.setflags(write=False)
+    return mesh
+
+
 class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
     """Sensitivity analysis.
 
@@ -104,6 +125,13 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
 
     DEFAULT_DRIVER = None
 
+    save_with_constrained_layout: bool = False
+    """Whether to save the plots with a constrained layout.
+
+    Otherwise, compute a tight bounding box,
+    which requires an additional rendering of the figure.
+    """
+
     _input_names: list[str]
     """The names of the inputs in parameter space order."""
 
@@ -463,7 +491,10 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
                 If it is a name, its first component is considered.
             mesh: The mesh on which the p-length output
                 is represented. Either a p-length array for a 1D functional output
-                or a (p, 2) array for a 2D one. If None, assume a 1D functional output.
+                or a (p, 2) array for a 2D one. If None, assume a 1D functional output
+                represented on an equispaced mesh of the unit interval;
+                this default mesh is read-only
+                as it is shared by the plots with the same number of nodes.
             inputs: The inputs to display. If None, display all inputs.
             standardize: If True, standardize the indices between 0 and 1 for each output.
             title: The title of the plot. If None, no title is displayed.
@@ -510,7 +541,7 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
         data = array(data)[:, :, 0]
         dataset = Dataset.from_array(data, [output_name], {output_name: data.shape[1]})
         dataset.index = input_names
-        mesh = linspace(0, 1, data.shape[1]) if mesh is None else mesh
+        mesh = _get_default_mesh(data.shape[1]) if mesh is None else mesh
         dataset.misc["mesh"] = mesh
         mesh_dimension = len(dataset.misc["mesh"].shape)
         if mesh_dimension == 1:
@@ -794,21 +825,25 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
         if isinstance(indices, SensitivityAnalysis):
             indices = [indices]
         methods = [self] + indices
-        dataset = Dataset()
         input_names = self._sort_and_filter_input_parameters(output, inputs)
-        for name in input_names:
-            data = abs(
-                array(
-                    [
-                        method.main_indices[output[0]][output[1]][name]
-                        for method in methods
-                    ]
-                )
-            )
-            dataset.add_variable(name, data)
-        data = dataset.get_view(group_names=dataset.PARAMETER_GROUP).to_numpy()
-        dataset.update_data(
-            data / data.max(axis=1)[:, newaxis], group_names=dataset.PARAMETER_GROUP
+        methods_indices = [
+            method.main_indices[output[0]][output[1]] for method in methods
+        ]
+        # The indices are normalized before creating the dataset
+        # rather than updating the dataset with its normalized data.
+        data = array(
+            [
+                concatenate([indices[name] for name in input_names])
+                for indices in methods_indices
+            ],
+            dtype=float,
+        )
+        absolute(data, out=data)
+        data /= data.max(axis=1, keepdims=True)
+        dataset = Dataset.from_array(
+            data,
+            input_names,
+            {name: methods_indices[0][name].size for name in input_names},
         )
         dataset.index = [method.main_method for method in methods]
         if use_bar_plot:
@@ -853,6 +888,7 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
         Returns:
             The figure.
         """
+        bbox_inches = "tight"
         if save:
             file_path = self._file_path_manager.create_file_path(
                 file_path=file_path,
@@ -860,10 +896,13 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
                 file_name=file_name,
                 file_extension=file_format,
             )
+            if self.save_with_constrained_layout:
+                use_constrained_layout(fig)
+                bbox_inches = None
         else:
             file_path = None
 
-        save_show_figure(fig, show, file_path)
+        save_show_figure(fig, show, file_path, bbox_inches=bbox_inches)
         return fig
 
     def to_dataset(self) -> Dataset:
@@ -875,34 +914,29 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
         sizes = self.dataset.variable_names_to_n_components
 
         row_names = []
+        input_slices = {}
+        first_index = 0
         for input_name in self.input_names:
-            for input_component in range(sizes[input_name]):
-                row_names.append(
-                    repr_variable(
-                        input_name,
-                        input_component,
-                        size=self.dataset.variable_names_to_n_components[input_name],
-                    )
-                )
+            size = sizes[input_name]
+            row_names.extend(
+                repr_variable(input_name, input_component, size=size)
+                for input_component in range(size)
+            )
+            last_index = first_index + size
+            input_slices[input_name] = slice(first_index, last_index)
+            first_index = last_index
 
         dataset = Dataset()
         for method, indices in self.indices.items():
-            variables = []
-            sizes = {}
-            data = []
-            for output, components in indices.items():
-                variables.append(output)
-                sizes[output] = len(components)
-                for component in components:
-                    data.append([component[name].tolist() for name in self.input_names])
-                    data[-1] = [item for sublist in data[-1] for item in sublist]
-            data = array(data).T
-            dataset.add_group(
-                method,
-                data,
-                [f"{v}" for v in variables],
-                {f"{v}": s for v, s in sizes.items()},
-            )
+            sizes = {
+                f"{output}": len(components) for output, components in indices.items()
+            }
+            data = empty((len(row_names), sum(sizes.values())))
+            for column, component in enumerate(chain.from_iterable(indices.values())):
+                for name, input_slice in input_slices.items():
+                    data[input_slice, column] = component[name]
+
+            dataset.add_group(method, data, list(sizes), sizes)
         dataset.index = row_names
         return dataset
 
@@ -921,16 +955,51 @@ class SensitivityAnalysis(metaclass=ABCGoogleDocstringInheritanceMeta):
         Returns:
             The standardized indices.
         """
-        new_indices = deepcopy(indices)
+        all_output_indices = [
+            output_component_indices
+            for output_indices in indices.values()
+            for output_component_indices in output_indices
+        ]
+        if not all_output_indices:
+            return {output_name: [] for output_name in indices}
+
+        # The indices of all the output components are stored in a matrix
+        # shaped as (total_n_output_components, total_input_size)
+        # to be standardized at once.
+        input_slices = {}
+        first_index = 0
+        for input_name, input_indices in all_output_indices[0].items():
+            last_index = first_index + input_indices.size
+            input_slices[input_name] = slice(first_index, last_index)
+            first_index = last_index
+
+        abs_indices = abs(
+            vstack(
+                [
+                    concatenate(
+                        [
+                            output_component_indices[input_name]
+                            for input_name in input_slices
+                        ]
+                    )
+                    for output_component_indices in all_output_indices
+                ]
+            )
+        )
+        first_components = [input_slice.start for input_slice in input_slices.values()]
+        standardized_indices = iter(
+            abs_indices / abs_indices[:, first_components].max(axis=1, keepdims=True)
+        )
+        new_indices = {}
         for output_name, output_indices in indices.items():
-            for output_component, output_component_indices in enumerate(output_indices):
-                max_value = max(
-                    abs(value)[0] for value in output_component_indices.values()
+            new_indices[output_name] = [
+                {
+                    input_name: output_component_indices[input_slice]
+                    for input_name, input_slice in input_slices.items()
+                }
+                for _, output_component_indices in zip(
+                    output_indices, standardized_indices
                 )
-
-                for input_name, input_indices in output_component_indices.items():
-                    new_indices[output_name][output_component][input_name] = (
-                        abs(input_indices) / max_value
-                    )
+            ]
 
         return new_indices
@@ -79,6 +79,7 @@ from typing import Sequence
 import matplotlib.pyplot as plt
 from numpy import abs as np_abs
 from numpy import array
+from numpy import maximum
 from numpy import ndarray
 from strenum import StrEnum
 
@@ -318,9 +319,7 @@ class MorrisAnalysis(SensitivityAnalysis):
             normalize: Whether to normalize the indices
                 with the empirical bounds of the outputs.
         """  # noqa: D205 D212 D415
-        fd_data = self.dataset.get_view(group_names=self.dataset.OUTPUT_GROUP).to_dict(
-            orient="list"
-        )
+        output_group_name = self.dataset.OUTPUT_GROUP
         output_names = outputs or self.default_output
         if isinstance(output_names, str):
             output_names = [output_names]
@@ -330,22 +329,29 @@ class MorrisAnalysis(SensitivityAnalysis):
         self.relative_sigma = {name: {} for name in output_names}
         self.min = {name: {} for name in output_names}
         self.max = {name: {} for name in output_names}
-        for fd_name, value in fd_data.items():
-            value = array([value]).T
-            output_name, input_name = _OATSensitivity.get_io_names(fd_name[1])
+        for fd_name in self.dataset.get_variable_names(output_group_name):
+            output_name, input_name = _OATSensitivity.get_io_names(fd_name)
             if output_name in output_names:
+                # The finite differences of all the components of the output,
+                # shaped as (n_replicates, output_dimension).
+                value = self.dataset.get_view(
+                    group_names=output_group_name, variable_names=fd_name
+                ).to_numpy()
                 lower = self.outputs_bounds[output_name][0]
                 upper = self.outputs_bounds[output_name][1]
 
+                abs_value = np_abs(value)
                 self.mu_[output_name][input_name] = value.mean(0)
-                self.mu_star[output_name][input_name] = np_abs(value).mean(0)
+                self.mu_star[output_name][input_name] = abs_value.mean(0)
                 self.sigma[output_name][input_name] = value.std(0)
-                self.min[output_name][input_name] = np_abs(value).min(0)
-                self.max[output_name][input_name] = np_abs(value).max(0)
+                self.min[output_name][input_name] = abs_value.min(0)
+                self.max[output_name][input_name] = abs_value.max(0)
 
                 if normalize:
                     self.mu_[output_name][input_name] /= upper - lower
-                    self.mu_star[output_name][input_name] /= max(abs(upper), abs(lower))
+                    self.mu_star[output_name][input_name] /= maximum(
+                        np_abs(upper), np_abs(lower)
+                    )
                     self.sigma[output_name][input_name] /= upper - lower
                     self.min[output_name][input_name] /= upper - lower
                     self.max[output_name][input_name] /= upper - lower
@@ -29,3 +29,14 @@ else:
 
     def get_color_map(colormap):  # noqa: N802, D103
         return plt.colormaps[colormap]
+
+
+if version.parse(matplotlib.__version__) < version.parse("3.6.0"):
+
+    def use_constrained_layout(figure):  # noqa: D103
+        figure.set_constrained_layout(True)
+
+else:
+
+    def use_constrained_layout(figure):  # noqa: D103
+        figure.set_layout_engine("constrained")
@@ -22,19 +22,25 @@ from __future__ import annotations
 
 import collections
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any
 from typing import Generator
 from typing import Iterable
 from typing import Mapping
+from typing import Sequence
 
 from numpy import array
 from numpy import concatenate
 from numpy import ndarray
 
 from gemseo.core.discipline_data import Data
+from gemseo.core.discipline_data import DisciplineData
 
 STRING_SEPARATOR = "#&#"
 
+__IMMUTABLE_TYPES = (bool, bytes, complex, float, int, str, type(None))
+"""The types of the values that do not need to be copied."""
+
 
 def concatenate_dict_of_arrays_to_array(
     dict_of_arrays: Mapping[str, ndarray],
@@ -62,7 +68,12 @@ def concatenate_dict_of_arrays_to_array(
     if not names:
         return array([])
 
-    return concatenate([dict_of_arrays[key] for key in names], -1)
+    arrays = [dict_of_arrays[key] for key in names]
+    if len(arrays) == 1:
+        # Copying is cheaper than concatenating a single array.
+        return array(arrays[0])
+
+    return concatenate(arrays, -1)
 
 
 dict_to_array = concatenate_dict_of_arrays_to_array
@@ -112,36 +123,83 @@ def split_array_to_dict_of_arrays(
         ValueError: When ``check_consistency`` is ``True`` and
             the sizes of the ``*names`` is inconsistent with the ``array`` shape.
     """
-    dimension = -len(names)
+    names = tuple(tuple(names_) for names_ in names)
+    sizes = tuple(tuple(names_to_sizes[name] for name in names_) for names_ in names)
     if check_consistency:
-        variables_size = sum(names_to_sizes[name] for name in names[0])
-        array_dimension_size = array.shape[dimension]
-        if variables_size != array_dimension_size:
-            raise ValueError(
-                "The total size of the elements ({}) "
-                "and the size of the last dimension of the array ({}) "
-                "are different.".format(variables_size, array_dimension_size)
-            )
+        for dimension, sizes_ in enumerate(sizes, -len(sizes)):
+            variables_size = sum(sizes_)
+            array_dimension_size = array.shape[dimension]
+            if variables_size != array_dimension_size:
+                raise ValueError(
+                    "The total size of the elements ({}) "
+                    "and the size of the last dimension of the array ({}) "
+                    "are different.".format(variables_size, array_dimension_size)
+                )
+
+    return __split_array_to_dict_of_arrays(
+        array, __compute_names_to_indices(names, sizes)
+    )
+
+
+@lru_cache(maxsize=256)
+def __compute_names_to_indices(
+    names: tuple[tuple[str, ...], ...],
+    sizes: tuple[tuple[int, ...], ...],
+) -> tuple[tuple[tuple[str, tuple[Any, ...]], ...], ...]:
+    """Compute the indices of the sub-arrays related to names.
+
+    The indices are computed once per dimension
+    instead of once per sub-array of the penultimate dimensions,
+    and cached as the same names and sizes are used repeatedly,
+    e.g. at each iteration of an MDA.
 
-    result = {}
-    first_index = 0
-    for name in names[0]:
-        size = names_to_sizes[name]
-        indices = [slice(None)] * array.ndim
-        indices[dimension] = slice(first_index, first_index + size)
-        if dimension == -1:
-            result[name] = array[tuple(indices)]
-        else:
-            result[name] = split_array_to_dict_of_arrays(
-                array[tuple(indices)],
-                names_to_sizes,
-                *names[1:],
-                check_consistency=check_consistency,
+    Args:
+        names: The names related to the NumPy array dimensions,
+            starting from the last one.
+        sizes: The sizes of the values related to ``names``.
+
+    Returns:
+        The names and indices of the sub-arrays for each dimension,
+        starting from the last one.
+    """
+    names_to_indices = []
+    for i, (names_, sizes_) in enumerate(zip(names, sizes)):
+        trailing_slices = (slice(None),) * (len(names) - i - 1)
+        names_and_indices = []
+        first_index = 0
+        for name, size in zip(names_, sizes_):
+            last_index = first_index + size
+            names_and_indices.append(
+                (name, (..., slice(first_index, last_index), *trailing_slices))
             )
+            first_index = last_index
+
+        names_to_indices.append(tuple(names_and_indices))
+
+    return tuple(names_to_indices)
+
+
+def __split_array_to_dict_of_arrays(
+    array: ndarray,
+    names_to_indices: Sequence[Sequence[tuple[str, tuple[Any, ...]]]],
+) -> dict[str, ndarray | dict[str, ndarray]]:
+    """Split a NumPy array into a dictionary of NumPy arrays from precomputed indices.
+
+    Args:
+        array: The NumPy array.
+        names_to_indices: The names and indices of the sub-arrays for each dimension,
+            starting from the last one.
 
-        first_index += size
+    Returns:
+        A dictionary of NumPy arrays related to the names.
+    """
+    if len(names_to_indices) == 1:
+        return {name: array[indices] for name, indices in names_to_indices[0]}
 
-    return result
+    return {
+        name: __split_array_to_dict_of_arrays(array[indices], names_to_indices[1:])
+        for name, indices in names_to_indices[0]
+    }
 
 
 array_to_dict = split_array_to_dict_of_arrays
@@ -189,11 +247,29 @@ def update_dict_of_arrays_from_array(
             * If the size of ``array`` is inconsistent
               with the shapes of the values of ``dict_of_arrays``.
     """
+    if not isinstance(names, Sequence):
+        # The names are iterated several times, e.g. when passed as a generator.
+        names = tuple(names)
+
     if not isinstance(array, ndarray):
         raise TypeError(f"The array must be a NumPy one, got instead: {type(array)}.")
 
     if copy:
-        data = deepcopy(dict_of_arrays)
+        # The values of names are not copied as they will be replaced.
+        names_to_update = set(names)
+        if isinstance(dict_of_arrays, DisciplineData):
+            # A shallow copy keeps the namespaces and the DataFrames.
+            data = dict_of_arrays.copy()
+            for key in tuple(data):
+                if key not in names_to_update:
+                    data[key] = __deepcopy_value(data[key])
+        else:
+            data = {}
+            for key, value in dict_of_arrays.items():
+                if key in names_to_update:
+                    data[key] = value
+                else:
+                    data[key] = __deepcopy_value(value)
     else:
         data = dict_of_arrays
 
@@ -272,15 +348,33 @@ def deepcopy_dict_of_arrays(
         # TODO: either let the following block raise a KeyError or log a warning
 
     for key in selected_keys:
-        value = dict_of_arrays[key]
-        if isinstance(value, ndarray):
-            deep_copy[key] = value.copy()
-        else:
-            deep_copy[key] = deepcopy(value)
+        deep_copy[key] = __deepcopy_value(dict_of_arrays[key])
 
     return deep_copy
 
 
+def __deepcopy_value(value: Any) -> Any:
+    """Perform a deep copy of a value.
+
+    A NumPy array is copied with ``array.copy()``,
+    an immutable scalar is not copied
+    and any other value is copied with ``deepcopy``.
+
+    Args:
+        value: The value to be copied.
+
+    Returns:
+        A deep copy of the value.
+    """
+    if isinstance(value, ndarray):
+        return value.copy()
+
+    if isinstance(value, __IMMUTABLE_TYPES):
+        return value
+
+    return deepcopy(value)
+
+
 def nest_flat_bilevel_dict(
     flat_dict: Mapping[str, Any],
     separator: str = STRING_SEPARATOR,
@@ -299,15 +393,10 @@ def nest_flat_bilevel_dict(
     Returns:
         A nested dictionary.
     """
-    keys = [key.split(separator) for key in flat_dict]
-    top_keys = {key[0] for key in keys}
-    sub_keys = {key[1] for key in keys}
     nested_dict = {}
-    for top_key in top_keys:
-        top_value = nested_dict[top_key] = {}
-        for sub_key in sub_keys:
-            key = separator.join([top_key, sub_key])
-            top_value[sub_key] = flat_dict[key]
+    for key, value in flat_dict.items():
+        top_key, sub_key = key.split(separator, 1)
+        nested_dict.setdefault(top_key, {})[sub_key] = value
 
     return nested_dict
 
@@ -357,9 +446,7 @@ def __nest_flat_mapping(
         separator: The keys separator,
             to be used as ``{parent_key}{separator}{child_key}``.
     """
-    keys = key.split(separator)
-    top_key = keys[0]
-    sub_keys = separator.join(keys[1:])
+    top_key, _, sub_keys = key.partition(separator)
     if sub_keys:
         __nest_flat_mapping(mapping.setdefault(top_key, {}), sub_keys, value, separator)
     else:
@@ -388,8 +475,7 @@ def flatten_nested_bilevel_dict(
     flat_dict = {}
     for top_key, top_value in nested_dict.items():
         for sub_key, sub_value in top_value.items():
-            key = separator.join([top_key, sub_key])
-            flat_dict[key] = sub_value
+            flat_dict[f"{top_key}{separator}{sub_key}"] = sub_value
 
     return flat_dict
 
@@ -436,7 +522,7 @@ def __flatten_nested_mapping(
     """
     for key, value in nested_mapping.items():
         if parent_key:
-            new_key = separator.join([parent_key, key])
+            new_key = f"{parent_key}{separator}{key}"
         else:
             new_key = key
 
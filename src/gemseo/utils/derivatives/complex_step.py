@@ -113,20 +113,15 @@ class ComplexStep(GradientApproximator):
         functions = [self._wrap_function] * n_perturbations
         parallel_execution = CallableParallelExecution(functions, **self._parallel_args)
 
-        perturbated_inputs = [
-            input_values + input_perturbations[:, perturbation_index]
-            for perturbation_index in range(n_perturbations)
-        ]
+        perturbated_inputs = list(input_values + input_perturbations.T)
         perturbated_outputs = parallel_execution.execute(perturbated_inputs)
-
-        gradient = []
-        for perturbation_index in range(n_perturbations):
-            gradient.append(
-                perturbated_outputs[perturbation_index].imag
-                / input_perturbations[perturbation_index, perturbation_index].imag
+        imaginary_steps = input_perturbations.diagonal().imag
+        return [
+            perturbated_output.imag / imaginary_step
+            for perturbated_output, imaginary_step in zip(
+                perturbated_outputs, imaginary_steps
             )
-
-        return gradient
+        ]
 
     def _compute_grad(
         self,
@@ -136,18 +131,14 @@ class ComplexStep(GradientApproximator):
         step: float,
         **kwargs: Any,
     ) -> ndarray:
-        gradient = []
-        for perturbation_index in range(n_perturbations):
-            perturbated_input = (
-                input_values + input_perturbations[:, perturbation_index]
+        perturbated_inputs = input_values + input_perturbations.T
+        imaginary_steps = input_perturbations.diagonal().imag
+        return [
+            self.f_pointer(perturbated_input, **kwargs).imag / imaginary_step
+            for perturbated_input, imaginary_step in zip(
+                perturbated_inputs, imaginary_steps
             )
-            perturbated_output = self.f_pointer(perturbated_input, **kwargs)
-            gradient.append(
-                perturbated_output.imag
-                / input_perturbations[perturbation_index, perturbation_index].imag
-            )
-
-        return gradient
+        ]
 
     def _generate_perturbations(
         self,
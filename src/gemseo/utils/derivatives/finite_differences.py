@@ -25,6 +25,7 @@ from typing import Final
 from typing import Sequence
 
 from numpy import argmax
+from numpy import array
 from numpy import full
 from numpy import ndarray
 from numpy import tile
@@ -107,14 +108,11 @@ class FirstOrderFD(GradientApproximator):
             [input_values] + perturbated_inputs
         )
 
-        gradient = []
-        initial_output = initial_and_perturbated_outputs[0]
-        for perturbation_index in range(n_perturbations):
-            perturbated_output = initial_and_perturbated_outputs[perturbation_index + 1]
-            g_approx = (perturbated_output - initial_output) / step[perturbation_index]
-            gradient.append(g_approx.real)
-
-        return gradient
+        return self.__compute_differences(
+            initial_and_perturbated_outputs[0],
+            initial_and_perturbated_outputs[1:],
+            step,
+        )
 
     def _compute_grad(
         self,
@@ -130,16 +128,30 @@ class FirstOrderFD(GradientApproximator):
         if not isinstance(step, ndarray):
             step = full(n_perturbations, step)
 
-        gradient = []
         initial_output = self.f_pointer(input_values, **kwargs)
-        for perturbation_index in range(n_perturbations):
-            perturbated_output = self.f_pointer(
-                input_perturbations[:, perturbation_index], **kwargs
-            )
-            g_approx = (perturbated_output - initial_output) / step[perturbation_index]
-            gradient.append(g_approx.real)
+        perturbated_outputs = [
+            self.f_pointer(perturbated_input, **kwargs)
+            for perturbated_input in input_perturbations.T
+        ]
+        return self.__compute_differences(initial_output, perturbated_outputs, step)
+
+    @staticmethod
+    def __compute_differences(
+        initial_output: ndarray,
+        perturbated_outputs: Sequence[ndarray],
+        step: ndarray,
+    ) -> ndarray:
+        """Compute the finite differences from the outputs of the function.
+
+        Args:
+            initial_output: The output at the input vector.
+            perturbated_outputs: The outputs at the perturbed input vectors.
+            step: The differentiation step by perturbation.
 
-        return gradient
+        Returns:
+            The finite differences, one row by perturbation.
+        """
+        return ((array(perturbated_outputs) - initial_output).T / step).T.real
 
     def _get_opt_step(
         self,
@@ -30,6 +30,7 @@ def save_show_figure(
     show: bool,
     file_path: str | Path,
     fig_size: FigSizeType | None = None,
+    bbox_inches: str | None = "tight",
 ) -> None:
     """Save or show a Matplotlib figure.
 
@@ -40,6 +41,10 @@ def save_show_figure(
             If ``None``, do not save the figure.
         fig_size: The width and height of the figure in inches, e.g. ``(w, h)``.
             If ``None``, use the current size of the figure.
+        bbox_inches: The bounding box of the saved figure in inches.
+            If ``"tight"``, compute a tight bounding box,
+            which requires an additional rendering of the figure.
+            If ``None``, use the whole figure.
     """
     save = file_path is not None
 
@@ -47,7 +52,7 @@ def save_show_figure(
         fig.set_size_inches(fig_size)
 
     if save:
-        fig.savefig(str(file_path), bbox_inches="tight")
+        fig.savefig(str(file_path), bbox_inches=bbox_inches)
 
     if show:
         plt.show()
@@ -15,9 +15,8 @@
 """Tools for unique run folder name generation."""
 from __future__ import annotations
 
-from ast import literal_eval
-from multiprocessing import Lock
 from multiprocessing import Value
+from os import scandir
 from pathlib import Path
 from uuid import uuid4
 
@@ -35,8 +34,6 @@ class RunFolderManager:
     """The number of existing run folders."""
     __output_folder_basepath: Path
     """The absolute path of the root folder of the run folders."""
-    __lock: Lock
-    """The non-recursive lock object."""
     __use_shell: bool
     """Whether to run the command using the default shell."""
     _folders_iter: FoldersIter
@@ -74,7 +71,6 @@ class RunFolderManager:
         self._folders_iter = folders_iter
         self.__check_base_path_on_windows()
         if folders_iter == FoldersIter.NUMBERED:
-            self.__lock = Lock()
             self.__counter = Value("i", self.__get_max_outdir())
         else:
             self.__counter = 1
@@ -104,11 +100,11 @@ class RunFolderManager:
             ValueError: If ``_folders_iter`` is not a :class:`.FoldersIter` object.
         """
         if self._folders_iter == FoldersIter.NUMBERED:
-            with self.__lock:
+            with self.__counter.get_lock():
                 self.__counter.value += 1
                 return str(self.__counter.value)
         elif self._folders_iter == FoldersIter.UUID:
-            return str(uuid4()).split("-")[-1]
+            return uuid4().hex[-12:]
         raise ValueError(
             f"{self._folders_iter} is not a valid method "
             "for creating the execution folders."
@@ -123,15 +119,15 @@ class RunFolderManager:
              The maximum index in the output folders.
         """
         # Only keep directories which are a number.
-        out_dirs = [
-            path.name
-            for path in self.__output_folder_basepath.iterdir()
-            if path.is_dir() and path.name.isdigit()
-        ]
-
-        if not out_dirs:
-            return 0
-        return max(literal_eval(n) for n in out_dirs)
+        with scandir(self.__output_folder_basepath) as entries:
+            return max(
+                (
+                    int(entry.name)
+                    for entry in entries
+                    if entry.name.isdecimal() and entry.is_dir()
+                ),
+                default=0,
+            )
 
     def __check_base_path_on_windows(self) -> None:
         """Check that the base path can be used.
@@ -34,6 +34,7 @@ Structural and Multidisciplinary Optimization, vol. 46, no. 2, p. 273-284, 2012.
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from json import dumps
 from multiprocessing import RLock
 from pathlib import Path
@@ -101,6 +102,8 @@ class XDSMizer:
         self.json_file_name = "xdsm.json"
         self.to_hashref = {}
         self.to_id = {}  # dictionary to map AtomicExecSequence to XDSM id
+        self.__opt_problem_representation = (None, "")
+        self.__last_html = (None, None)
         self.initialize(expected_workflow)
         self.log_workflow_status = False
         self.save_pdf = False
@@ -118,14 +121,18 @@ class XDSMizer:
                 If None, use the scenario's one.
         """
         self.sub_xdsmizers = []
+        self.__all_sub_xdsmizers = None
+        self.__edges_and_workflow = (None, None, None)
         # Find disciplines from workflow structure
         if workflow:
             self.workflow = workflow
         else:
             self.workflow = self.scenario.get_expected_workflow()
         self.atoms = XDSMizer._get_single_level_atoms(self.workflow)
+        self.__disciplines_to_atoms = {id(atom.discipline): atom for atom in self.atoms}
 
         self.to_hashref = {}
+        loop_sequences = self._get_loop_sequences(self.workflow)
         level = self.level + 1
         num = 1
         for atom in self.atoms:
@@ -136,7 +143,7 @@ class XDSMizer:
                 else:  # sub-scenario
                     name = atom.discipline.name
                     self.to_hashref[atom] = f"{name}_scn-{level}-{num}"
-                    sub_workflow = XDSMizer._find_sub_workflow(self.workflow, atom)
+                    sub_workflow = loop_sequences.get(atom.uuid)
                     self.sub_xdsmizers.append(
                         XDSMizer(
                             atom.discipline, self.to_hashref[atom], level, sub_workflow
@@ -177,9 +184,14 @@ class XDSMizer:
         Args:
             atom: The discipline which status is monitored.
         """
-        self.run(
-            directory_path=self.directory_path,
-            file_name=self.json_file_name,
+        # Unlike run, do not serialize the XDSM as a JSON string
+        # which would be discarded.
+        self.__export(
+            self.xdsmize(),
+            Path(self.directory_path),
+            self.json_file_name,
+            show_html=False,
+            save_html=True,
             save_pdf=self.save_pdf,
         )
         if self.log_workflow_status:
@@ -216,9 +228,41 @@ class XDSMizer:
 
         directory_path = Path(directory_path)
         if save_json:
-            with (directory_path / f"{file_name}.json").open("w") as file_stream:
-                file_stream.write(xdsm_json)
+            (directory_path / f"{file_name}.json").write_text(
+                xdsm_json, encoding="utf-8"
+            )
+
+        html_file_path = self.__export(
+            xdsm, directory_path, file_name, show_html, save_html, save_pdf
+        )
+        xdsm = XDSM(xdsm_json, html_file_path)
+        if show_html:
+            xdsm.visualize()
+
+        return xdsm
 
+    def __export(
+        self,
+        xdsm: dict[str, Any],
+        directory_path: Path,
+        file_name: str,
+        show_html: bool,
+        save_html: bool,
+        save_pdf: bool,
+    ) -> Path | None:
+        """Export the XDSM structure to HTML and PDF files.
+
+        Args:
+            xdsm: The XDSM structure.
+            directory_path: The path of the directory to save the files.
+            file_name: The file name to be suffixed by a file extension.
+            show_html: Whether the XDSM will be displayed in a web browser.
+            save_html: Whether to save the XDSM as a HTML file.
+            save_pdf: Whether to save the XDSM as a PDF file.
+
+        Returns:
+            The path to the HTML file if any.
+        """
         if save_pdf:
             xdsm_data_to_pdf(xdsm, directory_path, file_name)
 
@@ -230,13 +274,16 @@ class XDSMizer:
                 html_directory_path = Path(mkdtemp(suffix="", prefix="tmp"))
 
             html_file_path = (html_directory_path / file_name).with_suffix(".html")
-            generate_xdsm_html(xdsm, html_file_path)
-
-        xdsm = XDSM(xdsm_json, html_file_path)
-        if show_html:
-            xdsm.visualize()
+            # Monitoring can trigger several updates with the same XDSM;
+            # the HTML file is not written again in this case.
+            if (
+                self.__last_html != (html_file_path, xdsm)
+                or not html_file_path.exists()
+            ):
+                generate_xdsm_html(xdsm, html_file_path)
+                self.__last_html = (html_file_path, xdsm)
 
-        return xdsm
+        return html_file_path
 
     def get_all_sub_xdsmizers(self) -> list[XDSMizer]:
         """Retrieve all the sub-xdsmizers corresponding to the sub-scenarios.
@@ -244,11 +291,15 @@ class XDSMizer:
         Returns:
             The sub-xdsmizers.
         """
-        result = []
-        for sub in self.sub_xdsmizers:
-            result.append(sub)
-            result.extend(sub.get_all_sub_xdsmizers())
-        return result
+        if self.__all_sub_xdsmizers is None:
+            self.__all_sub_xdsmizers = []
+            sub_xdsmizers = list(reversed(self.sub_xdsmizers))
+            while sub_xdsmizers:
+                sub_xdsmizer = sub_xdsmizers.pop()
+                self.__all_sub_xdsmizers.append(sub_xdsmizer)
+                sub_xdsmizers.extend(reversed(sub_xdsmizer.sub_xdsmizers))
+
+        return self.__all_sub_xdsmizers
 
     @synchronized
     def xdsmize(
@@ -265,9 +316,16 @@ class XDSMizer:
             whose keys are "nodes", "edges", "workflow" and "optpb".
         """
         nodes = self._create_nodes(algoname)
-        edges = self._create_edges()
-        workflow = self._create_workflow()
-        optpb = str(self.scenario.formulation.opt_problem)
+        opt_problem_key = self.__get_opt_problem_key()
+        # The edges and the workflow do not depend on the statuses of the disciplines
+        # and so are computed again only when the optimization problem has changed.
+        cached_key, edges, workflow = self.__edges_and_workflow
+        if opt_problem_key != cached_key:
+            edges = self._create_edges()
+            workflow = self._create_workflow()
+            self.__edges_and_workflow = (opt_problem_key, edges, workflow)
+
+        optpb = self.__represent_opt_problem(opt_problem_key)
 
         if self.level == 0:
             res = {
@@ -294,6 +352,47 @@ class XDSMizer:
             return res
         return {"nodes": nodes, "edges": edges, "workflow": workflow, "optpb": optpb}
 
+    def __get_opt_problem_key(self) -> tuple[Any, ...]:
+        """Return a key identifying the current state of the optimization problem.
+
+        This key changes
+        when the functions, the design variables or the optimization sense
+        of the problem change.
+
+        Returns:
+            The key identifying the current state of the optimization problem.
+        """
+        opt_problem = self.scenario.formulation.opt_problem
+        return (
+            id(opt_problem),
+            id(opt_problem.objective),
+            opt_problem.minimize_objective,
+            opt_problem.use_standardized_objective,
+            tuple(map(id, opt_problem.constraints)),
+            tuple(map(id, opt_problem.observables)),
+            tuple(opt_problem.design_space.variable_names),
+        )
+
+    def __represent_opt_problem(self, key: tuple[Any, ...]) -> str:
+        """Return the string representation of the optimization problem.
+
+        This string is computed again
+        only when the key identifying the state of the problem
+        has changed since the last call.
+
+        Args:
+            key: The key identifying the current state of the optimization problem.
+
+        Returns:
+            The string representation of the optimization problem.
+        """
+        cached_key, representation = self.__opt_problem_representation
+        if key != cached_key:
+            representation = str(self.scenario.formulation.opt_problem)
+            self.__opt_problem_representation = (key, representation)
+
+        return representation
+
     def _create_nodes(
         self,
         algoname: str,
@@ -306,47 +405,32 @@ class XDSMizer:
         nodes = []
         self.to_id = {}
 
-        statuses = self.workflow.get_statuses()
+        get_status = self.workflow.get_statuses().get
 
         # Optimization
         self.to_id[self.root_atom] = OPT_ID
         opt_node = {"id": OPT_ID, "name": algoname, "type": "optimization"}
-        if statuses[self.root_atom.uuid]:
-            opt_node["status"] = statuses[self.root_atom.uuid]
+        status = get_status(self.root_atom.uuid)
+        if status:
+            opt_node["status"] = status
 
         nodes.append(opt_node)
+        # The nodes indexed by the identifiers of their disciplines.
+        discipline_ids_to_nodes = {id(self.root_atom.discipline): opt_node}
 
         # Disciplines
-        for atom_id, atom in enumerate(
-            self.atoms
-        ):  # pylint: disable=too-many-nested-blocks
+        for atom_id, atom in enumerate(self.atoms):
             # if a node already created from an atom with same discipline
             # at one level just reference the same node
-            for ref_atom in self.to_id:
-                if atom.discipline == ref_atom.discipline:
-                    self.to_id[atom] = self.to_id[ref_atom]
-
-                    if (
-                        atom.status
-                        and atom.parent.status is MDODiscipline.ExecutionStatus.RUNNING
-                    ):
-                        node = None
-                        for a_node in nodes:
-                            if a_node["id"] == self.to_id[atom]:
-                                node = a_node
-                                break
-
-                        if not node:
-                            # TODO: add specific exception?
-                            raise "Node " + self.to_id[
-                                atom
-                            ] + " not found in " + nodes  # pragma: no cover
-
-                        node["status"] = atom.status
-
-                    break
-
-            if atom in self.to_id:
+            node = discipline_ids_to_nodes.get(id(atom.discipline))
+            if node is not None:
+                self.to_id[atom] = node["id"]
+                if (
+                    atom.status
+                    and atom.parent.status is MDODiscipline.ExecutionStatus.RUNNING
+                ):
+                    node["status"] = atom.status
+
                 continue
 
             self.to_id[atom] = "Dis" + str(atom_id)
@@ -362,10 +446,12 @@ class XDSMizer:
             else:
                 node["type"] = "analysis"
 
-            if statuses[atom.uuid]:
-                node["status"] = statuses[atom.uuid]
+            status = get_status(atom.uuid)
+            if status:
+                node["status"] = status
 
             nodes.append(node)
+            discipline_ids_to_nodes[id(atom.discipline)] = node
 
         return nodes
 
@@ -391,19 +477,19 @@ class XDSMizer:
             edges.append(edge)
 
         # For User to/from optimization
-        opt_pb = self.scenario.formulation.opt_problem
+        functions = self.scenario.formulation.opt_problem.get_all_functions()
 
         # fct names such as -y4
-        function_name = opt_pb.get_all_function_name()
+        function_name = [function.name for function in functions]
 
         # output variables used by the fonction (eg y4)
-        fct_varnames = [f.output_names for f in opt_pb.get_all_functions()]
-        function_varnames = []
-        for fvars in fct_varnames:
-            function_varnames.extend(fvars)
+        function_varnames = set(
+            chain.from_iterable(function.output_names for function in functions)
+        )
 
         to_user = function_name
         to_opt = self.scenario.get_optim_variable_names()
+        optim_variable_names = set(to_opt)
 
         user_pattern = "L({})" if self.scenario.name == "Sampling" else "{}^(0)"
         opt_pattern = "{}^(1:N)" if self.scenario.name == "Sampling" else "{}^*"
@@ -411,38 +497,38 @@ class XDSMizer:
         add_edge(OPT_ID, USER_ID, [opt_pattern.format(x) for x in to_user])
 
         # Disciplines to/from optimization
+        atoms_to_output_names = {}
         for atom in self.atoms:
             if atom is not self.root_atom:
-                varnames = set(atom.discipline.get_input_data_names()) & set(
-                    self.scenario.get_optim_variable_names()
-                )
+                varnames = [
+                    name
+                    for name in atom.discipline.get_input_data_names()
+                    if name in optim_variable_names
+                ]
                 if varnames:
                     add_edge(OPT_ID, self.to_id[atom], varnames)
 
-                varnames = set(atom.discipline.get_output_data_names()) & set(
-                    function_varnames
-                )
+                output_names = atom.discipline.get_output_data_names()
+                atoms_to_output_names[atom] = output_names
+                varnames = [name for name in output_names if name in function_varnames]
                 if varnames:
                     add_edge(self.to_id[atom], OPT_ID, varnames)
 
         # Disciplines to User/Optimization (from User is already handled at
         # optimizer level)
-        disc_to_opt = function_varnames
         for atom in self.atoms:
             if atom is not self.root_atom:
                 # special case MDA : skipped
                 if isinstance(atom.discipline, MDA):
                     continue
-                out_to_user = [
-                    o
-                    for o in atom.discipline.get_output_data_names()
-                    if o not in disc_to_opt
-                ]
-                out_to_opt = [
-                    o
-                    for o in atom.discipline.get_output_data_names()
-                    if o in disc_to_opt
-                ]
+                out_to_user = []
+                out_to_opt = []
+                for output_name in atoms_to_output_names[atom]:
+                    if output_name in function_varnames:
+                        out_to_opt.append(output_name)
+                    else:
+                        out_to_user.append(output_name)
+
                 if out_to_user:
                     add_edge(self.to_id[atom], USER_ID, [x + "^*" for x in out_to_user])
                 if out_to_opt:
@@ -476,17 +562,17 @@ class XDSMizer:
             The atomic execution sequences.
         """
         atoms = []
-        for sequence in workflow.sequences:
+        sequences = list(reversed(workflow.sequences))
+        while sequences:
+            sequence = sequences.pop()
             if isinstance(sequence, LoopExecSequence):
                 atoms.append(sequence.atom_controller)
                 if not sequence.atom_controller.discipline.is_scenario():
-                    atoms += XDSMizer._get_single_level_atoms(
-                        sequence.iteration_sequence
-                    )
+                    sequences.extend(reversed(sequence.iteration_sequence.sequences))
             elif isinstance(sequence, AtomicExecSequence):
                 atoms.append(sequence)
             else:
-                atoms += XDSMizer._get_single_level_atoms(sequence)
+                sequences.extend(reversed(sequence.sequences))
         return atoms
 
     def _find_atom(
@@ -504,13 +590,10 @@ class XDSMizer:
         Raises:
             ValueError: If the atomic sequence is not found.
         """
-        atom = None
         if isinstance(discipline, MDOScenarioAdapter):
-            atom = self._find_atom(discipline.scenario)
-        else:
-            for atom_i in self.atoms:
-                if discipline == atom_i.discipline:
-                    atom = atom_i
+            return self._find_atom(discipline.scenario)
+
+        atom = self.__disciplines_to_atoms.get(id(discipline))
         if atom is None:
             disciplines = [a.discipline for a in self.atoms]
             raise ValueError(f"Discipline {discipline} not found in {disciplines}")
@@ -530,24 +613,34 @@ class XDSMizer:
 
         Returns:
             The sub-workflow.
-            None if the list of execution sequences of the original workflow is empty.
+            None if the workflow has no loop execution sequence controlled by this atom.
         """
-        sub_workflow = None
-        for sequence in workflow.sequences:
-            if isinstance(sequence, LoopExecSequence):
-                if sequence.atom_controller.uuid == atom_controller.uuid:
-                    sub_workflow = sequence
-                    return sub_workflow
+        return XDSMizer._get_loop_sequences(workflow).get(atom_controller.uuid)
+
+    @staticmethod
+    def _get_loop_sequences(
+        workflow: CompositeExecSequence,
+    ) -> dict[str, LoopExecSequence]:
+        """Retrieve the loop execution sequences of a workflow at any depth.
+
+        Args:
+            workflow: The workflow from which to retrieve the loop execution sequences.
 
-                sub_workflow = sub_workflow or XDSMizer._find_sub_workflow(
-                    sequence.iteration_sequence, atom_controller
-                )
+        Returns:
+            The loop execution sequences
+            bound to the UUIDs of the atomic execution sequences controlling them.
+        """
+        loop_sequences = {}
+        sequences = list(reversed(workflow.sequences))
+        while sequences:
+            sequence = sequences.pop()
+            if isinstance(sequence, LoopExecSequence):
+                loop_sequences.setdefault(sequence.atom_controller.uuid, sequence)
+                sequences.extend(reversed(sequence.iteration_sequence.sequences))
             elif not isinstance(sequence, AtomicExecSequence):
-                sub_workflow = sub_workflow or XDSMizer._find_sub_workflow(
-                    sequence, atom_controller
-                )
+                sequences.extend(reversed(sequence.sequences))
 
-        return sub_workflow
+        return loop_sequences
 
     def _create_workflow(self) -> list[str, IdsType]:
         """Manage the creation of the XDSM workflow creation from a formulation one."""
@@ -24,9 +24,12 @@ import logging
 import re
 import subprocess
 from ast import literal_eval
-from copy import deepcopy
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import Any
 from typing import Callable
+from typing import Final
 from typing import Mapping
 from typing import MutableSequence
 from typing import Sequence
@@ -45,9 +48,11 @@ from gemseo.utils.run_folder_manager import RunFolderManager
 
 LOGGER = logging.getLogger(__name__)
 
-NUMERICS = [str(j) for j in range(10)]
-INPUT_REGEX = r"GEMSEO_INPUT\{(.*)\}"
-OUTPUT_REGEX = r"GEMSEO_OUTPUT\{(.*)\}"
+INPUT_REGEX = r"GEMSEO_INPUT\{([^}]*)\}"
+OUTPUT_REGEX = r"GEMSEO_OUTPUT\{([^}]*)\}"
+_INPUT_PATTERN: Final[re.Pattern] = re.compile(INPUT_REGEX)
+_OUTPUT_PATTERN: Final[re.Pattern] = re.compile(OUTPUT_REGEX)
+_NUMBER_PATTERN: Final[re.Pattern] = re.compile(r"\s*[+-]?\d*\.?\d*(?:[eE][+-]?\d+)?")
 
 
 class Parser(StrEnum):
@@ -132,6 +137,13 @@ class DiscFromExe(MDODiscipline):
       to provide a specific parser to the :class:`.DiscFromExe`,
       with the :func:`.write_input_file_method`
       and :func:`.parse_outfile_method` arguments of the constructor.
+
+    As for any :class:`.MDODiscipline`,
+    the executable is not run again for input data already cached.
+    By default, only the last execution is cached;
+    use :meth:`.set_cache_policy` with :attr:`.MDODiscipline.CacheType.MEMORY_FULL`
+    to avoid running the executable again for any input data already evaluated,
+    e.g. when an optimizer evaluates the same point several times.
     """
 
     _run_folder_manager: RunFolderManager
@@ -214,7 +226,10 @@ class DiscFromExe(MDODiscipline):
             parse_out_separator: The separator used for the
                 :attr:`~.Parser.KEY_VALUE` output parser.
             use_shell: If ``True``, run the command using the default shell.
-                Otherwise, run directly the command.
+                Otherwise, run directly the command,
+                which saves the start of a shell process at each execution
+                but does not support the shell features,
+                e.g. redirections, pipes and environment variables.
             output_folder_basepath: The base path of the execution directories.
 
 
@@ -235,8 +250,8 @@ class DiscFromExe(MDODiscipline):
         if parse_outfile_method == Parser.TEMPLATE:
             self.parse_outfile = parse_outfile
         elif parse_outfile_method == Parser.KEY_VALUE:
-            self.parse_outfile = lambda a, b: parse_key_value_file(
-                a, b, parse_out_separator
+            self.parse_outfile = partial(
+                parse_key_value_file, separator=parse_out_separator
             )
         else:
             self.parse_outfile = parse_outfile_method
@@ -266,6 +281,7 @@ class DiscFromExe(MDODiscipline):
         self.input_grammar.update_from_names(input_names)
 
         names_to_values, self._out_pos = parse_template(self._out_lines, False)
+        self.__set_n_output_lines_to_parse()
         output_names = names_to_values.keys()
         self.output_grammar.update_from_names(output_names)
         LOGGER.debug(
@@ -275,9 +291,21 @@ class DiscFromExe(MDODiscipline):
             "Initialize discipline from template. Output grammar: %s", output_names
         )
         self.default_inputs = {
-            k: array([literal_eval(v)]) for k, v in self._input_data.items()
+            k: array([_parse_default_value(v)]) for k, v in self._input_data.items()
         }
 
+    def __set_n_output_lines_to_parse(self) -> None:
+        """Set the number of lines of the output file up to the last output."""
+        self.__n_output_lines_to_parse = 1 + max(
+            (line_number for _, _, line_number in self._out_pos.values()), default=-1
+        )
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        super().__setstate__(state)
+        # The disciplines pickled by the former versions do not have this attribute.
+        if "_DiscFromExe__n_output_lines_to_parse" not in state:
+            self.__set_n_output_lines_to_parse()
+
     def _run(self) -> None:
         out_dir = self._run_folder_manager.get_unique_run_folder_path()
         out_dir.mkdir()
@@ -303,17 +331,42 @@ class DiscFromExe(MDODiscipline):
             raise RuntimeError(f"Execution failed and returned error code: {err}.")
 
         with open(out_dir / self.output_filename) as outfile:
-            out_lines = outfile.readlines()
-
-        if len(out_lines) != len(self._out_lines):
-            raise ValueError(
-                "The number of lines of the output file changed."
-                "This is not supported yet"
-            )
+            if self.parse_outfile is parse_outfile:
+                # This parser only reads the lines up to the last output.
+                out_lines = list(islice(outfile, self.__n_output_lines_to_parse))
+                if len(out_lines) != self.__n_output_lines_to_parse:
+                    raise ValueError(
+                        f"The output file has {len(out_lines)} lines "
+                        f"but the outputs are expected on the first "
+                        f"{self.__n_output_lines_to_parse} lines."
+                    )
+            else:
+                out_lines = outfile.readlines()
+                if len(out_lines) != len(self._out_lines):
+                    raise ValueError(
+                        "The number of lines of the output file changed."
+                        "This is not supported yet"
+                    )
 
         self.local_data.update(self.parse_outfile(self._out_pos, out_lines))
 
 
+def _parse_default_value(value: str) -> Any:
+    """Parse the default value of a variable read from a template.
+
+    Args:
+        value: The default value as a string.
+
+    Returns:
+        The default value.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        # The default value is not a number, e.g. a list.
+        return literal_eval(value)
+
+
 def parse_template(
     template_lines: Sequence[str],
     grammar_is_input: bool,
@@ -343,11 +396,20 @@ def parse_template(
     Returns:
         A data structure containing the parsed input or output template.
     """
-    regex = re.compile(INPUT_REGEX if grammar_is_input else OUTPUT_REGEX)
-    # , re.MULTILINE
+    if grammar_is_input:
+        regex = _INPUT_PATTERN
+        marker = "GEMSEO_INPUT{"
+    else:
+        regex = _OUTPUT_PATTERN
+        marker = "GEMSEO_OUTPUT{"
+
     names_to_values = {}
     names_to_positions = {}
     for line_index, line in enumerate(template_lines):
+        # Most of the lines do not contain any variable.
+        if marker not in line:
+            continue
+
         for match in regex.finditer(line):
             name, value = match.groups()[0].split("::")
             names_to_values[name] = value
@@ -386,15 +448,32 @@ def write_input_file(
         input_lines: The lines of the file.
         float_format: The format of the input data in the file.
     """
-    f_text = deepcopy(input_lines)
+    line_numbers_to_positions = {}
     for input_name, (start, end, line_number) in input_positions.items():
-        cline = f_text[line_number]
-        f_text[line_number] = (
-            cline[:start] + float_format.format(data[input_name]) + cline[end:]
+        line_numbers_to_positions.setdefault(line_number, []).append(
+            (start, end, input_name)
         )
 
-    with open(input_file_path, "w") as infile_o:
-        infile_o.writelines(f_text)
+    format_value = float_format.format
+    line_numbers_to_lines = {}
+    for line_number, positions in line_numbers_to_positions.items():
+        line = input_lines[line_number]
+        segments = []
+        position = 0
+        for start, end, input_name in sorted(positions):
+            segments.append(line[position:start])
+            segments.append(format_value(data[input_name]))
+            position = end
+
+        segments.append(line[position:])
+        line_numbers_to_lines[line_number] = "".join(segments)
+
+    Path(input_file_path).write_text(
+        "".join(
+            line_numbers_to_lines.get(line_number, line)
+            for line_number, line in enumerate(input_lines)
+        )
+    )
 
 
 def parse_key_value_file(
@@ -418,12 +497,11 @@ def parse_key_value_file(
     """
     data = {}
     for line in out_lines:
-        if separator in line:
-            key_and_value = line.strip().split(separator)
-            if len(key_and_value) != 2:
+        key, found_separator, value = line.partition(separator)
+        if found_separator:
+            if separator in value:
                 raise ValueError(f"unbalanced = in line {line}.")
 
-            key, value = key_and_value
             try:
                 data[key.strip()] = float(literal_eval(value.strip()))
             except Exception:
@@ -453,39 +531,13 @@ def parse_outfile(
     """
     values = {}
     for output_name, (start, _, line_number) in output_positions.items():
-        found_dot = False
-        found_e = False
         # In case generated files has fewer lines
         if line_number > len(out_lines) - 1:
             break
-        out_text = out_lines[line_number]
-        i = start
-        maxi = len(out_text)
-        while True:
-            # The problem is that the output file used for the template may be
-            # using an output that is longer or shorter than the one generated
-            # at runtime. We must find the proper end of the expression...
-            i += 1
-            char = out_text[i]
-            if char == ".":
-                # We found the . in float notation
-                if found_dot or found_e:
-                    break
-                found_dot = True
-                continue
-            # We found the e in exp notation
-            if char in ("E", "e"):
-                if found_e:
-                    break
-                found_e = True
-                continue
-            # Check that we have nout reached EOL or space or whatever
-            if char not in NUMERICS:
-                break
-            if i == maxi - 1:
-                break
-
-        output_value = out_text[start:i]
+        # The problem is that the output file used for the template may be
+        # using an output that is longer or shorter than the one generated
+        # at runtime. The number is thus matched from its start position.
+        output_value = _NUMBER_PATTERN.match(out_lines[line_number], start).group()
         LOGGER.info("Parsed %s got output %s", output_name, output_value)
         values[output_name] = array([float(output_value)])
 
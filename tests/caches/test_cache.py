@@ -24,6 +24,7 @@ import re
 import shutil
 from pathlib import Path
 from typing import Iterator
+from unittest.mock import patch
 
 import h5py
 import pytest
@@ -46,6 +47,7 @@ from numpy import array
 from numpy import eye
 from numpy import float64
 from numpy import zeros
+from numpy.testing import assert_equal
 from scipy.sparse import eye as speye
 
 DIR_PATH = Path(__file__).parent
@@ -171,6 +173,18 @@ def test_hdf_cache_read(tmp_wd):
         )
 
 
+def test_to_ggobi_complex(tmp_wd):
+    """Check that the complex data are exported to GGobi with their imaginary part."""
+    cache = CacheFactory().create("MemoryFullCache")
+    cache.cache_outputs({"x": array([1.0 + 2.0j])}, {"y": array([3.0, 4.0j])})
+    with patch("gemseo.core.cache.save_data_arrays_to_xml") as save_data_arrays_to_xml:
+        cache.to_ggobi("out.ggobi")
+
+    variable_names, cache_as_array, _ = save_data_arrays_to_xml.call_args.args
+    assert variable_names == ["x", "y_1", "y_2"]
+    assert_equal(cache_as_array, array([[1.0 + 2.0j, 3.0, 4.0j]]))
+
+
 def test_update_caches(tmp_wd):
     c1 = HDF5Cache(hdf_file_path="out11.h5", hdf_node_path="DummyCache")
     c2 = HDF5Cache(hdf_file_path="out21.h5", hdf_node_path="DummyCache")
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
 import platform
 import re
 import sys
@@ -49,9 +50,12 @@ from gemseo.problems.sobieski.disciplines import SobieskiPropulsion
 from gemseo.problems.sobieski.disciplines import SobieskiStructure
 from gemseo.utils.repr_html import REPR_HTML_WRAPPER
 from numpy import array
+from numpy import array_equal
 from numpy import complex128
+from numpy import concatenate
 from numpy import ndarray
 from numpy import ones
+from numpy import zeros
 from numpy.linalg import norm
 from scipy.sparse import spmatrix
 
@@ -69,20 +73,38 @@ def check_jac_equals(
     Returns:
         True if the two jacobian matrices are equal.
     """
-    if not sorted(jac_1.keys()) == sorted(jac_2.keys()):
+    if jac_1.keys() != jac_2.keys():
         return False
-    for out, jac_dict in jac_1.items():
-        if not sorted(jac_dict.keys()) == sorted(jac_2[out].keys()):
-            return False
-        for inpt, jac_loc in jac_dict.items():
-            if not (jac_loc == jac_2[out][inpt]).all():
-                return False
 
-    return True
+    blocks = [(out, inpt) for out, jac_dict in jac_1.items() for inpt in jac_dict]
+    if set(blocks) != {(out, inpt) for out, jac in jac_2.items() for inpt in jac}:
+        return False
+
+    if not blocks:
+        return True
+
+    blocks_1 = [jac_1[out][inpt] for out, inpt in blocks]
+    blocks_2 = [jac_2[out][inpt] for out, inpt in blocks]
+    if [block.shape for block in blocks_1] != [block.shape for block in blocks_2]:
+        return False
+
+    return array_equal(
+        concatenate([block.ravel() for block in blocks_1]),
+        concatenate([block.ravel() for block in blocks_2]),
+    )
+
+
+@pytest.fixture(scope="module")
+def sobieski_problem() -> SobieskiProblem:
+    """The Sobieski's SSBJ problem.
+
+    Its default inputs are new arrays at each call and can be modified by the tests.
+    """
+    return SobieskiProblem()
 
 
 @pytest.fixture
-def sobieski_chain() -> tuple[MDOChain, dict[str, ndarray]]:
+def sobieski_chain(sobieski_problem) -> tuple[MDOChain, dict[str, ndarray]]:
     """Build a Sobieski chain.
 
     Returns:
@@ -98,7 +120,7 @@ def sobieski_chain() -> tuple[MDOChain, dict[str, ndarray]]:
         ]
     )
     chain_inputs = chain.input_grammar.keys()
-    indata = SobieskiProblem().get_default_inputs(names=chain_inputs)
+    indata = sobieski_problem.get_default_inputs(names=chain_inputs)
     return chain, indata
 
 
@@ -148,7 +170,7 @@ def test_check_input_data_exception_chain(sobieski_chain):
 @pytest.mark.parametrize(
     "grammar_type", [MDODiscipline.GrammarType.JSON, MDODiscipline.GrammarType.SIMPLE]
 )
-def test_check_input_data_exception(grammar_type):
+def test_check_input_data_exception(grammar_type, sobieski_problem):
     """Test the check input data exception."""
     if grammar_type == MDODiscipline.GrammarType.SIMPLE:
         struct = SobieskiStructureSG()
@@ -156,7 +178,7 @@ def test_check_input_data_exception(grammar_type):
         struct = SobieskiStructure()
 
     struct_inputs = struct.input_grammar.keys()
-    indata = SobieskiProblem().get_default_inputs(names=struct_inputs)
+    indata = sobieski_problem.get_default_inputs(names=struct_inputs)
     del indata["x_1"]
 
     with pytest.raises(InvalidDataError, match=".*Missing required names: x_1"):
@@ -169,12 +191,12 @@ def test_check_input_data_exception(grammar_type):
         struct.execute(indata)
 
 
-def test_outputs():
+def test_outputs(sobieski_problem):
     """Test the execution of a MDODiscipline."""
     struct = SobieskiStructure()
     with pytest.raises(InvalidDataError):
         struct.check_output_data()
-    indata = SobieskiProblem().get_default_inputs()
+    indata = sobieski_problem.get_default_inputs()
     struct.execute(indata)
     in_array = struct.get_inputs_asarray()
     assert len(in_array) == 13
@@ -254,37 +276,33 @@ def test_check_jac_approx_plot(tmp_wd, pyplot_close_all):
     assert os.path.exists(file_path)
 
 
-def test_check_lin_threshold():
+def test_check_lin_threshold(sobieski_problem):
     """Check the linearization threshold."""
     aero = SobieskiAerodynamics()
-    problem = SobieskiProblem()
-    indata = problem.get_default_inputs(names=aero.get_input_data_names())
+    indata = sobieski_problem.get_default_inputs(names=aero.get_input_data_names())
     aero.check_jacobian(indata, threshold=1e-50)
 
 
-def test_input_exist():
+def test_input_exist(sobieski_problem):
     """Test is_input_existing."""
     sr = SobieskiAerodynamics()
-    problem = SobieskiProblem()
-    indata = problem.get_default_inputs(names=sr.get_input_data_names())
+    indata = sobieski_problem.get_default_inputs(names=sr.get_input_data_names())
     assert sr.is_input_existing(next(iter(indata.keys())))
     assert not sr.is_input_existing("bidon")
 
 
-def test_get_all_inputs_outputs_name():
+def test_get_all_inputs_outputs_name(sobieski_problem):
     """Test get_all_input_outputs_name method."""
     aero = SobieskiAerodynamics()
-    problem = SobieskiProblem()
-    indata = problem.get_default_inputs(names=aero.get_input_data_names())
+    indata = sobieski_problem.get_default_inputs(names=aero.get_input_data_names())
     for data_name in indata:
         assert data_name in aero.get_input_data_names()
 
 
-def test_get_all_inputs_outputs():
+def test_get_all_inputs_outputs(sobieski_problem):
     """Test get all_inputs_outputs method."""
     aero = SobieskiAerodynamics()
-    problem = SobieskiProblem()
-    indata = problem.get_default_inputs(names=aero.get_input_data_names())
+    indata = sobieski_problem.get_default_inputs(names=aero.get_input_data_names())
     aero.execute(indata)
     aero.get_all_inputs()
     aero.get_all_outputs()
@@ -296,19 +314,19 @@ def test_get_all_inputs_outputs():
     assert len(arr) > 0
 
 
-def test_serialize_deserialize(tmp_wd):
+def test_serialize_deserialize(tmp_wd, sobieski_problem):
     """Test the serialization/deserialization method."""
     aero = SobieskiAerodynamics()
     aero.data_processor = ComplexDataProcessor()
     out_file = "sellar1.o"
-    input_data = SobieskiProblem().get_default_inputs()
+    input_data = sobieski_problem.get_default_inputs()
     aero.execute(input_data)
     locd = aero.local_data
     aero.to_pickle(out_file)
     saero_u = MDODiscipline.from_pickle(out_file)
     for k, v in locd.items():
         assert k in saero_u.local_data
-        assert (v == saero_u.local_data[k]).all()
+        assert array_equal(v, saero_u.local_data[k])
 
     def attr_list():
         return ["numpy_test"]
@@ -325,11 +343,11 @@ def test_serialize_deserialize(tmp_wd):
     assert ok
 
 
-def test_serialize_run_deserialize(tmp_wd):
+def test_serialize_run_deserialize(tmp_wd, sobieski_problem):
     """Test serialization, run and deserialization."""
     aero = SobieskiAerodynamics()
     out_file = "sellar1.o"
-    input_data = SobieskiProblem().get_default_inputs()
+    input_data = sobieski_problem.get_default_inputs()
     aero.to_pickle(out_file)
     saero_u = MDODiscipline.from_pickle(out_file)
     saero_u.to_pickle(out_file)
@@ -341,7 +359,15 @@ def test_serialize_run_deserialize(tmp_wd):
 
     for k, v in saero_loc.local_data.items():
         assert k in saero_u.local_data
-        assert (v == saero_u.local_data[k]).all()
+        assert array_equal(v, saero_u.local_data[k])
+
+
+def test_to_pickle_protocol(tmp_wd):
+    """Check that a discipline is serialized with the highest pickle protocol."""
+    file_path = Path("discipline.pkl")
+    SobieskiMission().to_pickle(file_path)
+    with file_path.open("rb") as file_:
+        assert file_.read(2) == pickle.PROTO + bytes([pickle.HIGHEST_PROTOCOL])
 
 
 def test_serialize_hdf_cache(tmp_wd):
@@ -356,10 +382,10 @@ def test_serialize_hdf_cache(tmp_wd):
     assert saero_u.cache.last_entry.outputs["y_2"] is not None
 
 
-def test_data_processor():
+def test_data_processor(sobieski_problem):
     """Test the data processor."""
     aero = SobieskiAerodynamics()
-    input_data = SobieskiProblem().get_default_inputs()
+    input_data = sobieski_problem.get_default_inputs()
     aero.data_processor = ComplexDataProcessor()
     out_data = aero.execute(input_data)
     for v in out_data.values():
@@ -368,7 +394,7 @@ def test_data_processor():
     # Mix data processor and cache
     out_data2 = aero.execute(input_data)
     for k, v in out_data.items():
-        assert (out_data2[k] == v).all()
+        assert array_equal(out_data2[k], v)
 
 
 def test_diff_inputs_outputs():
@@ -512,7 +538,7 @@ def test_check_jacobian_2():
 
         def _compute_jacobian(self, inputs=None, outputs=None):
             self._init_jacobian()
-            self.jac = {"y": {self.jac_key: array([[0.0] * self.jac_len])}}
+            self.jac = {"y": {self.jac_key: zeros((1, self.jac_len))}}
 
     disc = LinDisc()
     disc.jac_key = "z"
@@ -536,7 +562,7 @@ def test_check_jacobian_2():
 def test_check_jacobian_parallel_fd():
     """Test check_jacobian in parallel."""
     sm = SobieskiMission()
-    sm.check_jacobian(step=1e-6, threshold=1e-6, parallel=True, n_processes=6)
+    sm.check_jacobian(step=1e-6, threshold=1e-6, parallel=True, n_processes=2)
 
 
 def test_check_jacobian_parallel_cplx():
@@ -547,7 +573,7 @@ def test_check_jacobian_parallel_cplx():
         step=1e-30,
         threshold=1e-6,
         parallel=True,
-        n_processes=6,
+        n_processes=2,
     )
 
 
@@ -578,17 +604,17 @@ def test_execute_rerun_errors():
 
 def test_cache():
     """Test the MDODiscipline cache."""
-    sm = SobieskiMission(enable_delay=0.1)
+    sm = SobieskiMission()
     sm.cache_tol = 1e-6
     xs = sm.default_inputs["x_shared"]
     sm.execute({"x_shared": xs})
     t0 = sm.exec_time
     sm.execute({"x_shared": xs + 1e-12})
-    t1 = sm.exec_time
-    assert t0 == t1
+    assert sm.n_calls == 1
+    assert sm.exec_time == t0
     sm.execute({"x_shared": xs + 0.1})
-    t2 = sm.exec_time
-    assert t2 > t1
+    assert sm.n_calls == 2
+    assert sm.exec_time > t0
 
     sm.exec_time = 1.0
     assert sm.exec_time == 1.0
@@ -596,20 +622,18 @@ def test_cache():
 
 def test_cache_h5(tmp_wd):
     """Test the HDF5 cache."""
-    sm = SobieskiMission(enable_delay=0.1)
+    sm = SobieskiMission()
     hdf_file = sm.name + ".hdf5"
     sm.set_cache_policy(sm.CacheType.HDF5, cache_hdf_file=hdf_file)
     xs = sm.default_inputs["x_shared"]
     sm.execute({"x_shared": xs})
-    t0 = sm.exec_time
     sm.execute({"x_shared": xs})
-    assert t0 == sm.exec_time
+    assert sm.n_calls == 1
     sm.cache_tol = 1e-6
-    t0 = sm.exec_time
     sm.execute({"x_shared": xs + 1e-12})
-    assert t0 == sm.exec_time
+    assert sm.n_calls == 1
     sm.execute({"x_shared": xs + 1e12})
-    assert t0 != sm.exec_time
+    assert sm.n_calls == 2
     # Read again the hashes
     sm.cache = HDF5Cache(hdf_file_path=hdf_file, hdf_node_path=sm.name)
 
@@ -617,31 +641,24 @@ def test_cache_h5(tmp_wd):
         sm.set_cache_policy(cache_type="toto")
 
 
-def test_cache_h5_inpts(tmp_wd):
-    """Test the HD5 cache for inputs."""
-    sm = SobieskiMission()
-    hdf_file = sm.name + ".hdf5"
-    sm.set_cache_policy(sm.CacheType.HDF5, cache_hdf_file=hdf_file)
-    xs = sm.default_inputs["x_shared"]
-    sm.execute({"x_shared": xs})
-    out_ref = sm.local_data["y_4"]
-    sm.execute({"x_shared": xs + 1.0})
-    sm.execute({"x_shared": xs})
-    assert (sm.local_data["x_shared"] == xs).all()
-    assert (sm.local_data["y_4"] == out_ref).all()
-
-
-def test_cache_memory_inpts():
-    """Test the CacheType.MEMORY_FULL."""
+@pytest.mark.parametrize(
+    "cache_type,options",
+    [
+        (MDODiscipline.CacheType.HDF5, {"cache_hdf_file": "SobieskiMission.hdf5"}),
+        (MDODiscipline.CacheType.MEMORY_FULL, {}),
+    ],
+)
+def test_cache_inpts(tmp_wd, cache_type, options):
+    """Test that a cache restores the inputs and outputs of a previous execution."""
     sm = SobieskiMission()
-    sm.set_cache_policy(sm.CacheType.MEMORY_FULL)
+    sm.set_cache_policy(cache_type, **options)
     xs = sm.default_inputs["x_shared"]
     sm.execute({"x_shared": xs})
     out_ref = sm.local_data["y_4"]
     sm.execute({"x_shared": xs + 1.0})
     sm.execute({"x_shared": xs})
-    assert (sm.local_data["x_shared"] == xs).all()
-    assert (sm.local_data["y_4"] == out_ref).all()
+    assert array_equal(sm.local_data["x_shared"], xs)
+    assert array_equal(sm.local_data["y_4"], out_ref)
 
 
 def test_cache_h5_jac(tmp_wd):
@@ -20,7 +20,7 @@
 from __future__ import annotations
 
 import unittest
-from timeit import default_timer as timer
+from unittest.mock import patch
 
 import pytest
 from gemseo import create_design_space
@@ -141,12 +141,13 @@ class TestParallelExecution(unittest.TestCase):
             inpts[X_SHARED][0] = i
             input_list.append(inpts)
 
-        t_0 = timer()
-        outs = parallel_execution.execute(input_list)
-        t_f = timer()
+        with patch(
+            "gemseo.core.parallel_execution.callable_parallel_execution.time.sleep"
+        ) as sleep:
+            outs = parallel_execution.execute(input_list)
 
-        elapsed_time = t_f - t_0
-        assert elapsed_time > 0.1 * (n - 1)
+        assert sleep.call_count == n - 1
+        assert all(call.args == (0.1,) for call in sleep.call_args_list)
 
         assert s_1.n_calls == n
 
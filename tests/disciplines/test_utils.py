@@ -54,3 +54,11 @@ def test_get_all_inputs(disciplines_and_scenario, skip_scenarios, expected):
 def test_get_all_outputs(disciplines_and_scenario, skip_scenarios, expected):
     """Check get_all_outputs."""
     assert get_all_outputs(disciplines_and_scenario, skip_scenarios) == expected
+
+
+@pytest.mark.parametrize("skip_scenarios", [False, True])
+def test_get_all_inputs_and_outputs_without_scenario(skip_scenarios):
+    """Check get_all_inputs and get_all_outputs without scenario."""
+    disciplines = [AnalyticDiscipline({"y1": "x1"}, name="f1")]
+    assert get_all_inputs(disciplines, skip_scenarios) == ["x1"]
+    assert get_all_outputs(disciplines, skip_scenarios) == ["y1"]
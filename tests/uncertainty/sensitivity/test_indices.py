@@ -38,6 +38,7 @@ from numpy import linspace
 from numpy import pi
 from numpy import sin
 from numpy.testing import assert_array_equal
+from numpy.testing import assert_equal
 
 
 @pytest.fixture
@@ -359,6 +360,19 @@ def test_plot_1d_field(kwargs, baseline_images, output, ishigami, pyplot_close_a
     ishigami.plot_field(output, save=False, show=False, **kwargs)
 
 
+def test_plot_1d_field_default_mesh(ishigami, pyplot_close_all):
+    """Check that the default mesh is cached and read-only."""
+    plot = ishigami.plot_field("out", save=False, show=False)
+    mesh = plot.dataset.misc["mesh"]
+    assert_equal(mesh, linspace(0.0, 1.0, len(mesh)))
+    assert not mesh.flags.writeable
+    with pytest.raises(ValueError, match="assignment destination is read-only"):
+        mesh[0] = 1.0
+
+    other_plot = ishigami.plot_field("out", save=False, show=False)
+    assert other_plot.dataset.misc["mesh"] is mesh
+
+
 TWO_D_FIELD_TEST_PARAMETERS_WO_MESH = {
     "without_option": ({}, ["2d_field_wo_mesh"]),
 }
@@ -415,6 +429,22 @@ def test_standardize_indices():
     assert standardized_indices == expected_standardized_indices
 
 
+def test_standardize_indices_with_vector_inputs():
+    """Check standardize_indices() with an input of dimension 2."""
+    indices = {
+        "y1": [{"x1": array([-2.0, 1.0]), "x2": array([0.5])}],
+        "y2": [{"x1": array([0.0, 1.0]), "x2": array([-0.5])}],
+    }
+    standardized_indices = SensitivityAnalysis.standardize_indices(indices)
+    assert_equal(
+        standardized_indices,
+        {
+            "y1": [{"x1": array([1.0, 0.5]), "x2": array([0.25])}],
+            "y2": [{"x1": array([0.0, 2.0]), "x2": array([1.0])}],
+        },
+    )
+
+
 def test_multiple_disciplines(parameter_space):
     """Test a SensitivityAnalysis with multiple disciplines.
 
@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import re
+from unittest.mock import patch
 
 import pytest
 from gemseo import create_discipline
@@ -170,6 +171,24 @@ def test_plot(morris, output_name, kwargs, baseline_images, pyplot_close_all):
     morris.plot(output_name, save=False, **kwargs)
 
 
+@pytest.mark.parametrize(
+    ("save_with_constrained_layout", "bbox_inches"), [(False, "tight"), (True, None)]
+)
+def test_plot_layout(
+    tmp_wd, morris, save_with_constrained_layout, bbox_inches, pyplot_close_all
+):
+    """Check the layout of the saved plot."""
+    morris.save_with_constrained_layout = save_with_constrained_layout
+    with patch(
+        "gemseo.uncertainty.sensitivity.analysis.save_show_figure"
+    ) as save_show_figure:
+        morris.plot("y1", save=True)
+
+    figure = save_show_figure.call_args.args[0]
+    assert save_show_figure.call_args.kwargs["bbox_inches"] == bbox_inches
+    assert figure.get_constrained_layout() is save_with_constrained_layout
+
+
 @pytest.mark.parametrize(
     "output,expected", [("y1", ["x2", "x3", "x1"]), ("y2", ["x3", "x2", "x1"])]
 )
@@ -334,6 +353,49 @@ def test_normalize(morris):
             )
 
 
+def _vector_function(x1=0.0, x2=0.0):
+    """A function with a 2-length output whose components change sign."""
+    y = array([x1 - 2 * x2, 3 * x2 - x1 - 0.5])
+    return y
+
+
+def test_normalize_vector_output():
+    """Check the normalization of the indices of an output with several components."""
+    space = ParameterSpace()
+    for name in ["x1", "x2"]:
+        space.add_random_variable(
+            name, "OTUniformDistribution", minimum=-1.0, maximum=1.0
+        )
+
+    discipline = AutoPyDiscipline(_vector_function)
+    analysis = MorrisAnalysis([discipline], space, n_samples=None, n_replicates=5)
+    lower, upper = analysis.outputs_bounds["y"]
+    assert (lower < 0).all() and (upper > 0).all()
+
+    analysis.compute_indices()
+    mu_ = analysis.mu_["y"]
+    mu_star = analysis.mu_star["y"]
+    sigma = analysis.sigma["y"]
+    analysis.compute_indices(normalize=True)
+    assert len(analysis.mu_star["y"]) == 2
+    for component in range(2):
+        lower_i = lower[component]
+        upper_i = upper[component]
+        for input_name in ["x1", "x2"]:
+            assert allclose(
+                analysis.mu_["y"][component][input_name],
+                mu_[component][input_name] / (upper_i - lower_i),
+            )
+            assert allclose(
+                analysis.mu_star["y"][component][input_name],
+                mu_star[component][input_name] / max(abs(upper_i), abs(lower_i)),
+            )
+            assert allclose(
+                analysis.sigma["y"][component][input_name],
+                sigma[component][input_name] / (upper_i - lower_i),
+            )
+
+
 def test_morris_multiple_disciplines():
     """Test the Morris Analysis for more than one discipline."""
     expressions = [{"y1": "x1+x3+y2"}, {"y2": "x2+x3+2*y1"}, {"f": "x3+y1+y2"}]
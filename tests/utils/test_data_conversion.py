@@ -21,6 +21,7 @@ from __future__ import annotations
 import re
 
 import pytest
+from gemseo.core.discipline_data import DisciplineData
 from gemseo.utils.comparisons import compare_dict_of_arrays
 from gemseo.utils.data_conversion import array_to_dict
 from gemseo.utils.data_conversion import concatenate_dict_of_arrays_to_array
@@ -35,6 +36,7 @@ from gemseo.utils.data_conversion import update_dict_of_arrays_from_array
 from numpy import array
 from numpy import array_equal
 from numpy import ndarray
+from pandas import DataFrame
 from scipy.sparse import csr_matrix
 
 
@@ -87,6 +89,47 @@ def test_update_dict_of_arrays_from_array_without_variables(dict_to_be_updated):
     assert compare_dict_of_arrays(new_data_dict, dict_to_be_updated)
 
 
+def test_update_dict_of_arrays_from_array_copy(dict_to_be_updated):
+    """Check that the values that are not updated are copied."""
+    new_data_dict = update_dict_of_arrays_from_array(
+        dict_to_be_updated, ["y"], array([0.5])
+    )
+    assert list(new_data_dict) == ["x", "y", "z"]
+    assert new_data_dict["x"] is not dict_to_be_updated["x"]
+    assert array_equal(new_data_dict["x"], dict_to_be_updated["x"])
+    assert array_equal(new_data_dict["y"], array([0.5]))
+    assert array_equal(dict_to_be_updated["y"], array([2.0]))
+
+
+def test_update_dict_of_arrays_from_array_generator(dict_to_be_updated):
+    """Check the update of a data mapping from a generator of names."""
+    new_data_dict = update_dict_of_arrays_from_array(
+        dict_to_be_updated, (name for name in ["y"]), array([0.5])
+    )
+    assert compare_dict_of_arrays(
+        new_data_dict, {"x": array([0.0, 1.0]), "y": array([0.5]), "z": array([3, 4])}
+    )
+
+
+def test_update_dict_of_arrays_from_array_discipline_data():
+    """Check that the values of a DisciplineData that are not updated are copied."""
+    data_frame = DataFrame({"a": array([1.0])})
+    discipline_data = DisciplineData(
+        {"x": array([0.0, 1.0]), "y": array([2.0]), "df": data_frame},
+        input_to_namespaced={"y": "ns:y"},
+    )
+    new_data = update_dict_of_arrays_from_array(discipline_data, ["y"], array([0.5]))
+    assert isinstance(new_data, DisciplineData)
+    assert new_data.input_to_namespaced == {"y": "ns:y"}
+    assert array_equal(new_data["y"], array([0.5]))
+    assert array_equal(discipline_data["y"], array([2.0]))
+
+    new_data["x"][0] = 3.0
+    new_data["df~a"][0] = 3.0
+    assert array_equal(discipline_data["x"], array([0.0, 1.0]))
+    assert array_equal(data_frame["a"].to_numpy(), array([1.0]))
+
+
 def test_update_dict_of_arrays_from_array_wrong_data_type(dict_to_be_updated):
     """Check that a dictionary cannot be updated from wrongly typed data."""
     expected = r"The array must be a NumPy one, got instead: <.+ 'float'>\."
@@ -193,6 +236,14 @@ def test_concatenate_dict_of_arrays_to_array(xy_dict, names, expected):
     assert array_equal(concatenate_dict_of_arrays_to_array(xy_dict, names), expected)
 
 
+def test_concatenate_dict_of_arrays_to_array_single_name():
+    """Check that concatenate_dict_of_arrays_to_array copies a single array."""
+    dict_of_arrays = {"x": array([1.0, 2.0])}
+    result = concatenate_dict_of_arrays_to_array(dict_of_arrays, ["x"])
+    result[0] = 3.0
+    assert array_equal(dict_of_arrays["x"], array([1.0, 2.0]))
+
+
 @pytest.mark.parametrize(
     "names,expected",
     [
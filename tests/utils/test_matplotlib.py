@@ -41,3 +41,13 @@ def test_process(tmp_wd, pyplot_close_all, file_path, show, fig_size):
         assert Path(file_path).exists()
 
     plt.fignum_exists(fig.number)
+
+
+@pytest.mark.parametrize("bbox_inches", ["tight", None])
+def test_bbox_inches(tmp_wd, pyplot_close_all, bbox_inches):
+    """Verify that the bounding box of the saved figure can be set."""
+    fig, axes = plt.subplots()
+    with patch.object(fig, "savefig") as savefig:
+        save_show_figure(fig, False, "file_name.png", bbox_inches=bbox_inches)
+
+    savefig.assert_called_once_with("file_name.png", bbox_inches=bbox_inches)
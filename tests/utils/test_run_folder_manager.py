@@ -72,6 +72,16 @@ def test_get_unique_run_folder_path_empty(empty_directory):
     )
 
 
+def test_get_unique_run_folder_path_zero_padded(empty_directory):
+    """Check that the zero-padded numbered folders are considered."""
+    Path("empty_resource_dir/007").mkdir()
+    folder_manager = RunFolderManager("empty_resource_dir")
+    assert (
+        folder_manager.get_unique_run_folder_path()
+        == Path("empty_resource_dir/8").absolute()
+    )
+
+
 def test_uuid_folder(tmp_wd, directories):
     """Test that unique folder based on ``UUID`` can be written in a non empty
     directory."""
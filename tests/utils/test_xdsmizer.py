@@ -24,6 +24,7 @@ from copy import deepcopy
 from pathlib import Path
 from typing import Any
 from typing import Mapping
+from unittest.mock import patch
 
 import pytest
 from gemseo import create_discipline
@@ -680,3 +681,99 @@ def test_run_return(tmp_wd, directory_path, file_name, save_html):
         html_file_path = xdsm.html_file_path
         assert html_file_path.exists()
         assert html_file_path.name == html_file_name
+
+
+def test_get_all_sub_xdsmizers():
+    """Check that the sub-xdsmizers are retrieved in depth-first order once."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    discipline = AnalyticDiscipline({"y": "x"})
+    scenario = MDOScenario([discipline], "DisciplinaryOpt", "y", design_space)
+    xdsmizer, sub_1, sub_1_1, sub_2 = (XDSMizer(scenario) for _ in range(4))
+    sub_1.sub_xdsmizers = [sub_1_1]
+    xdsmizer.sub_xdsmizers = [sub_1, sub_2]
+    all_sub_xdsmizers = xdsmizer.get_all_sub_xdsmizers()
+    assert all_sub_xdsmizers == [sub_1, sub_1_1, sub_2]
+    assert xdsmizer.get_all_sub_xdsmizers() is all_sub_xdsmizers
+
+    xdsmizer.initialize()
+    assert xdsmizer.get_all_sub_xdsmizers() == []
+
+
+def test_xdsmize_reuses_edges_and_workflow():
+    """Check that the edges and the workflow are reused for an unchanged problem."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    discipline = AnalyticDiscipline({"y": "x"})
+    scenario = MDOScenario([discipline], "DisciplinaryOpt", "y", design_space)
+    xdsmizer = XDSMizer(scenario)
+    xdsm = xdsmizer.xdsmize()["root"]
+    other_xdsm = xdsmizer.xdsmize()["root"]
+    assert other_xdsm["edges"] is xdsm["edges"]
+    assert other_xdsm["workflow"] is xdsm["workflow"]
+
+    xdsmizer.initialize()
+    other_xdsm = xdsmizer.xdsmize()["root"]
+    assert other_xdsm["edges"] is not xdsm["edges"]
+    assert other_xdsm["edges"] == xdsm["edges"]
+    assert other_xdsm["workflow"] == xdsm["workflow"]
+
+
+def test_xdsmize_edges_after_add_constraint():
+    """Check that the edges follow the changes of the optimization problem."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    discipline = AnalyticDiscipline({"y": "x", "z": "x"})
+    scenario = MDOScenario([discipline], "DisciplinaryOpt", "y", design_space)
+    xdsmizer = XDSMizer(scenario)
+    edges = xdsmizer.xdsmize()["root"]["edges"]
+
+    scenario.add_constraint("z")
+    other_edges = xdsmizer.xdsmize()["root"]["edges"]
+    assert other_edges != edges
+    assert other_edges == XDSMizer(scenario).xdsmize()["root"]["edges"]
+    assert {"from": "Dis1", "to": "Opt", "name": "y, z"} in other_edges
+
+
+def test_xdsmize_optimization_problem_representation():
+    """Check that the representation of the problem follows its changes."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    discipline = AnalyticDiscipline({"y": "x", "z": "x"})
+    scenario = MDOScenario([discipline], "DisciplinaryOpt", "y", design_space)
+    xdsmizer = XDSMizer(scenario)
+    optpb = xdsmizer.xdsmize()["root"]["optpb"]
+    assert xdsmizer.xdsmize()["root"]["optpb"] is optpb
+
+    scenario.add_constraint("z")
+    other_optpb = xdsmizer.xdsmize()["root"]["optpb"]
+    assert other_optpb == str(scenario.formulation.opt_problem)
+    assert other_optpb != optpb
+
+
+def test_run_html_not_written_again(tmp_wd):
+    """Check that the HTML file is written again only when the XDSM changes."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    discipline = AnalyticDiscipline({"y": "x", "z": "x"})
+    scenario = MDOScenario([discipline], "DisciplinaryOpt", "y", design_space)
+    xdsmizer = XDSMizer(scenario)
+    with patch("gemseo.utils.xdsmizer.generate_xdsm_html") as generate_xdsm_html:
+        generate_xdsm_html.side_effect = lambda _, path: path.touch()
+        xdsmizer.run()
+        xdsmizer.run()
+        assert generate_xdsm_html.call_count == 1
+
+        xdsmizer.run(file_name="foo")
+        assert generate_xdsm_html.call_count == 2
+
+        scenario.add_constraint("z")
+        xdsmizer.run(file_name="foo")
+        assert generate_xdsm_html.call_count == 3
+        xdsm = generate_xdsm_html.call_args.args[0]
+        assert xdsm == XDSMizer(scenario).xdsmize()
+        assert {"from": "Dis1", "to": "Opt", "name": "y, z"} in xdsm["root"]["edges"]
+
+        Path("foo.html").unlink()
+        xdsmizer.run(file_name="foo")
+        assert generate_xdsm_html.call_count == 4
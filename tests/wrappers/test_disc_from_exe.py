@@ -30,10 +30,12 @@ from gemseo import create_discipline
 from gemseo import create_scenario
 from gemseo.algos.design_space import DesignSpace
 from gemseo.utils.run_folder_manager import FoldersIter
+from gemseo.wrappers.disc_from_exe import DiscFromExe
 from gemseo.wrappers.disc_from_exe import parse_key_value_file
 from gemseo.wrappers.disc_from_exe import parse_outfile
 from gemseo.wrappers.disc_from_exe import parse_template
 from gemseo.wrappers.disc_from_exe import Parser
+from gemseo.wrappers.disc_from_exe import write_input_file
 from numpy import array
 
 from .cfgobj_exe import execute as exec_cfg
@@ -277,6 +279,63 @@ def test_disc_from_exe_fail_exe(xfail_if_windows_unc_issue, tmp_wd):
         disc.execute(indata)
 
 
+def test_disc_from_exe_template_output_lines(xfail_if_windows_unc_issue, tmp_wd):
+    """Check the lines of the output file read by the template output parser."""
+    sum_path = join(DIRNAME, "cfgobj_exe_fails.py")
+    disc = create_discipline(
+        "DiscFromExe",
+        input_template=join(DIRNAME, "input_template.cfg"),
+        output_template=join(DIRNAME, "output_template.cfg"),
+        output_folder_basepath=str(tmp_wd),
+        executable_command=f"python {sum_path} -i input.cfg -o output.cfg -f wrong_len",
+        input_filename="input.cfg",
+        output_filename="output.cfg",
+    )
+    indata = {"input 1": array([1]), "input 2": array([3]), "input 3": array([2])}
+    # The lines following the last output are ignored.
+    assert disc.execute(indata)["out 1"] == array([6.0])
+
+    output_template = Path(DIRNAME, "output_template.cfg").read_text()
+    Path("output_template.cfg").write_text(
+        f"{output_template}out 3 = GEMSEO_OUTPUT{{out 3:: 1.0}}"
+    )
+    disc = create_discipline(
+        "DiscFromExe",
+        input_template=join(DIRNAME, "input_template.cfg"),
+        output_template="output_template.cfg",
+        output_folder_basepath=str(tmp_wd),
+        executable_command=f"python {sum_path} -i input.cfg -o output.cfg",
+        input_filename="input.cfg",
+        output_filename="output.cfg",
+    )
+    with pytest.raises(
+        ValueError,
+        match="The output file has 4 lines but the outputs are expected "
+        "on the first 5 lines.",
+    ):
+        disc.execute(indata)
+
+
+def test_disc_from_exe_former_pickle(xfail_if_windows_unc_issue, tmp_wd):
+    """Check the execution of a discipline pickled by a former version."""
+    sum_path = join(DIRNAME, "cfgobj_exe.py")
+    disc = create_discipline(
+        "DiscFromExe",
+        input_template=join(DIRNAME, "input_template.cfg"),
+        output_template=join(DIRNAME, "output_template.cfg"),
+        output_folder_basepath=str(tmp_wd),
+        executable_command=f"python {sum_path} -i input.cfg -o output.cfg",
+        input_filename="input.cfg",
+        output_filename="output.cfg",
+    )
+    state = disc.__getstate__()
+    del state["_DiscFromExe__n_output_lines_to_parse"]
+    former_disc = DiscFromExe.__new__(DiscFromExe)
+    former_disc.__setstate__(state)
+    indata = {"input 1": array([1]), "input 2": array([3]), "input 3": array([2])}
+    assert former_disc.execute(indata)["out 1"] == array([6.0])
+
+
 def test_parse_key_value_file():
     data = parse_key_value_file(None, ["a = 1.0"])
     assert data["a"] == 1.0
@@ -331,7 +390,35 @@ def test_parse_outfile():
     output_mod = deepcopy(output)
     output_mod[0] = output_mod[0][:-1]
     values2 = parse_outfile(out_pos, output_mod)
-    assert values2["out 1"] == 1.0
+    assert values2["out 1"] == 1.4
+
+    output_mod = deepcopy(output)
+    output_mod[0] = output_mod[0].replace("1.4", "-14e-1")
+    values2 = parse_outfile(out_pos, output_mod)
+    assert values2["out 1"] == -1.4
+
+
+def test_parse_template_several_variables_per_line():
+    """Check that a template line can contain several variables."""
+    names_to_values, names_to_positions = parse_template(
+        ["a = GEMSEO_INPUT{a::1.0}, b = GEMSEO_INPUT{b::2.0}\n"], True
+    )
+    assert names_to_values == {"a": "1.0", "b": "2.0"}
+    assert names_to_positions == {"a": (4, 24, 0), "b": (30, 50, 0)}
+
+
+def test_write_input_file_several_variables_per_line(tmp_wd):
+    """Check that several variables of a template line are written."""
+    input_lines = ["a = GEMSEO_INPUT{a::1.0}, b = GEMSEO_INPUT{b::2.0}\n", "c\n"]
+    _, input_positions = parse_template(input_lines, True)
+    write_input_file(
+        "input.txt",
+        {"a": 3.0, "b": -4.5},
+        input_positions,
+        input_lines,
+        float_format="{:g}",
+    )
+    assert Path("input.txt").read_text() == "a = 3, b = -4.5\nc\n"
 
 
 def test_parallel_execution(xfail_if_windows_unc_issue, tmp_wd):